@@ -1,558 +1,568 @@
-# -*- coding: utf-8 -*-
-"""
-Created on Mon Mar 12 21:35:41 2018
-
-Adapted by Dmetri Hayes for the Spring 2018 version of CogSci 88
-
-@author: dmetri
-"""
-
-import pandas as pd
-import matplotlib.pyplot as plt
-import numpy as np
-
-__all__ = ['readChipData', 'get_chip_to_rgb', 'get_chip_to_munsell', 
-           'readNamingData', 'readFociData', 'readSpeakerData', 'makeModeMap',
-           'naming2grid', 'plotColorGrid']
-
-### Utility function
-def _read_lines(filename):
-    '''
-    Reads in the lines of raw text from a filename.
-    '''
-    with open(filename, 'r') as f:
-        text = f.read()
-    lines = text.rstrip().split('\n')
-    
-    return lines
-
-### Color chip information
-def _get_munsell_dicts(lines):
-    '''
-    Gets the Munsell coordinates to chip number dictionary 
-    and the inverse from the lines of the raw text.
-    '''
-    munsell_to_chip = {}
-    chip_to_munsell = {}
-    for row in lines:
-        vals = row.split('\t')
-        # the index is first
-        index = int(vals[0])
-        # the Munsell coordinates are the last two values
-        L, H = vals[-2:]
-        # link each Munsell coordinates to the corresponding chip number
-        munsell_to_chip[L+H] = index
-        # link each chip number to its Munsell coordinate tuple        
-        chip_to_munsell[index] = (L, int(H))
-        
-    return munsell_to_chip, chip_to_munsell
-
-def _get_clab_dict(lines):
-    '''
-    Gets the chip number to CIELAB coordinates 
-    dictionary from the lines of the raw text.
-    '''
-    chip_to_clab = {}
-    for row in lines:
-        vals = row.split('\t')
-        # the index is first
-        index = int(vals[0])
-        # the CIELAB coordinates are 4:7
-        clab = [float(v) for v in vals[4:7]]
-        # link each chip number to its CIELAB coordinates
-        chip_to_clab[index] = tuple(clab)
-        
-    return chip_to_clab
-
-def _get_rgb_dict(lines):
-    '''
-    Gets the chip number to RGB values 
-    dictionary from the lines of the raw text.
-    '''
-    chip_to_rgb = {}
-    for row in lines:
-        vals = row.split('\t')
-        # the index is first
-        index = int(vals[0])
-        # the RGB values are 1:4
-        rgb = [int(v) for v in vals[1:4]]
-        # link each chip number to its RGB values tuple
-        chip_to_rgb[index] = tuple(rgb)
-        
-    return chip_to_rgb
-
-def readChipData(filename='chipnum-info.txt', getFrame=False):
-    '''
-    Reads the color information for each of the color 
-    chips as either a series of dictionaries or as a 
-    Pandas DataFrame.
-    
-    Args:
-        filename (str, optional): the path to the chip data
-        getFrame (bool, optional): if True, returns 
-            the information as a DataFrame. Otherwise, 
-            the information is returned as a series of
-            dictionaries.
-    
-    Returns:
-        four dictionaries, mapping:
-            -each chip number to its Munsell coordinates
-            -Munsell coordinates to the chip number
-            -each chip number to its CIELAB values
-            -each chip number to its RGB values
-        
-        or a DataFrame containing the chip number, 
-        lightness, hue, R, G, B, l a*, and b* values for
-        each of the color chips
-    
-    Examples:
-        >>> data = readChipData('chipnum-info.txt')
-        >>> munsell_to_chip, chip_to_munsell, chip_to_clab, chip_to_rgb = data
-        ...
-        >>> df_chip = readChipData('chipnum-info.txt', getFrame=True)
-    '''
-    if getFrame:
-        data = pd.read_table(filename, header=None)
-        # add the column names
-        columns = ['ChipNum', 'R', 'G', 'B', 'l', 'a', 'b', 'Lightness', 'Hue']
-        data.columns = columns
-        return data
-    # otherwise, read in a series of dictionaries
-    lines = _read_lines(filename)
-    
-    # link each Munsell coordinates to the corresponding chip number
-    # link each chip number to its Munsell coordinate tuple
-    munsell_to_chip, chip_to_munsell = _get_munsell_dicts(lines)
-        
-    # link each chip number to its CIELAB coordinates
-    chip_to_clab = _get_clab_dict(lines)
-    
-    # link each chip number to its RGB values tuple
-    chip_to_rgb = _get_rgb_dict(lines)
-    
-    return munsell_to_chip, chip_to_munsell, chip_to_clab, chip_to_rgb
-
-def get_chip_to_rgb(filename_or_dataframe):
-    '''
-    Gets the chip number to RGB values dictionary, either
-    by loading it from a file or extracting it from a 
-    Pandas DataFrame.
-    
-    Args:
-        filename_or_dataframe (str or `DataFrame`): the
-            path to the chip data or a DataFrame containing 
-            the chip numbers and RGB values
-    
-    Returns:
-        a dictionary mapping each chip number to its RGB values
-    
-    Examples:
-        >>> chip_to_rgb = get_chip_to_rgb('chipnum-info.txt')
-        ...
-        >>> chip_to_rgb = get_chip_to_rgb(df_chip)
-    '''
-    if type(filename_or_dataframe) == str:
-        lines = _read_lines(filename_or_dataframe)
-        chip_to_rgb = _get_rgb_dict(lines)
-    elif type(filename_or_dataframe) == pd.DataFrame:
-        df_chip = filename_or_dataframe
-        # get the chip numbers and the RGB values
-        chips = df_chip['ChipNum'].values
-        rgb_vals = df_chip[['R', 'G', 'B']].values
-        # create the dictionary
-        chip_to_rgb = {}
-        for i in range(len(chips)):
-            chip_to_rgb[chips[i]] = tuple(rgb_vals[i])
-    else:
-        print('Warning: No data provided.')
-        chip_to_rgb = {}
-        
-    return chip_to_rgb
-    
-def get_chip_to_munsell(filename_or_dataframe):
-    '''
-    Gets the chip number to Munsell coordinates dictionary, 
-    either by loading it from a file or extracting it from 
-    a Pandas DataFrame.
-    
-    Args:
-        filename_or_dataframe (str or `DataFrame`): the
-            path to the chip data or a DataFrame containing 
-            the chip numbers and Munsell coordinates
-    
-    Returns:
-        a chip number mapping each chip number to its 
-        Munsell coordinates
-    
-    Examples:
-        >>> chip_to_munsell = get_chip_to_munsell('chipnum-info.txt')
-        ...
-        >>> chip_to_munsell = get_chip_to_munsell(df_chip)
-    '''
-    if type(filename_or_dataframe) == str:
-        lines = _read_lines(filename_or_dataframe)
-        _, chip_to_munsell = _get_munsell_dicts(lines)
-    elif type(filename_or_dataframe) == pd.DataFrame:
-        df_chip = filename_or_dataframe
-        # get the chip numbers and the RGB values
-        chips = df_chip['ChipNum'].values
-        munsell_vals = df_chip[['Lightness', 'Hue']].values
-        # create the dictionary
-        chip_to_munsell = {}
-        for i in range(len(chips)):
-            chip_to_munsell[chips[i]] = tuple(munsell_vals[i])
-    else:
-        print('Warning: No data provided.')
-        chip_to_munsell = {}
-        
-    return chip_to_munsell
-
-### Naming data
-def readNamingData(filename='term.txt', getFrame=False):
-    '''
-    Loads the naming data into a hierarchical dictionary 
-    or as a Pandas DataFrame.
-    
-    Args:
-        filename (str, optional): the path to the naming data
-        getFrame (bool, optional): if True, returns 
-            the information as a DataFrame. Otherwise, 
-            the information is returned as a hierarchical
-            dictionaries.
-            
-    Returns:
-        a hierarchical dictionary mapping each language 
-        to each speaker's naming data, which maps each 
-        color index to their given color term, or a 
-        DataFrame with this same information
-    
-    Examples:
-        >>> namingData = readNamingData('term.txt')
-        ...
-        >>> df_naming = readNamingData('term.txt', getFrame=True)
-    '''
-    if getFrame:
-        data = pd.read_table(filename, header=None)
-        # add the column names
-        columns = ['Language', 'Speaker', 'ChipNum', 'Term']
-        data.columns = columns
-        return data
-    # otherwise, read in as a hierarchical dictionary
-    lines = _read_lines(filename)
-    # create a nested dictionary
-    namingData = {}
-    # loop through the lines and add them to the dictionary
-    for l in lines:
-        # get the information from the line
-        [lang, spkr, chipNum, term] = l.split('\t')
-        # add the language dict if it doesn't exist
-        if int(lang) not in namingData.keys():
-            namingData[int(lang)] = {}
-        # get the language naming dictionary
-        langDict = namingData[int(lang)]
-        # add the speaker dict if it doesn't exist
-        if int(spkr) not in langDict.keys():
-            langDict[int(spkr)] = {}
-        # get the speaker naming dictionary
-        spkrDict = langDict[int(spkr)]
-        # add the speaker's term for this chip number
-        spkrDict[int(chipNum)] = term
-        
-    return namingData
-
-### Foci data
-def readFociData(filename='foci-exp.txt', getFrame=False):
-    '''
-    Loads the foci data into a hierarchical dictionary 
-    or as a Pandas DataFrame.
-    
-    Args:
-        filename (str, optional): the path to the foci data
-        getFrame (bool, optional): if True, returns 
-            the information as a DataFrame. Otherwise, 
-            the information is returned as a hierarchical
-            dictionaries.
-            
-    Returns:
-        a hierarchical dictionary mapping each language 
-        to each speaker's naming data, which maps each 
-        color term to its foci Munsell coordinates, or a 
-        DataFrame with this same information
-    
-    Examples:
-        >>> fociData = readNamingData('foci-exp.txt')
-        ...
-        >>> df_foci = readFociData('foci-exp.txt', getFrame=True)
-    '''
-    if getFrame:
-        data = pd.read_table(filename, header=None)     
-        # add the column names
-        columns = ['Language', 'Speaker', 'TermNum', 'Term', 'Foci']
-        data.columns = columns
-        # fix bad WCS entries: collapse A1-40 to A0 and J1-40 to J0
-        data['Foci'] = data['Foci'].str.replace('A.*', 'A0')
-        data['Foci'] = data['Foci'].str.replace('J.*', 'J0')
-        # separate lightness and hue values with a colon
-        # create a function to apply to the columns
-        myFun = lambda x: ('%s:%s' % (str(x)[0], str(x)[1:]))
-        # get the new foci values
-        newFoci = data['Foci'].apply(myFun)
-        # replace the old foci values
-        data['Foci'] = newFoci
-        return data
-    # otherwise, read in as a hierarchical dictionary
-    lines = _read_lines(filename)
-    # create a nested dictionary
-    fociData = {}
-    # loop through the lines and add them to the dictionary
-    for l in lines:
-        # get the information from the line (TermNum isn't used)
-        [lang, spkr, _, term, foci] = l.split('\t')
-        # add the language dict if it doesn't exist
-        if int(lang) not in fociData.keys():
-            fociData[int(lang)] = {}
-        # get the language foci dictionary
-        langDict = fociData[int(lang)]
-        # add the speaker dict if it doesn't exist
-        if int(spkr) not in langDict.keys():
-            langDict[int(spkr)] = {}
-        # get the speaker foci dictionary
-        spkrDict = langDict[int(spkr)]
-        # add the speaker's foci list if it doesn't exit
-        if term not in spkrDict.keys():
-            spkrDict[term] = []
-        
-        # fix bad WCS entries: collapse A1-40 to A0 and J1-40 to J0
-        if (foci[0] == 'A'):
-            foci = 'A0'
-        if (foci[0] == 'J'):
-            foci = 'J0'
-        
-        # separate lightness and hue values with a colon
-        newFoci = '%s:%s' % (foci[0], foci[1:])
-        # add this foci data
-        spkrDict[term].append(newFoci)
-        
-    return fociData
-
-### Speaker data
-def readSpeakerData(filename='spkr-lsas.txt', getFrame=False):
-    '''
-    Loads the speaker's age and gender information into a 
-    dictionary or a Pandas DataFrame.
-    
-    Args:
-        filename (str, optional): the path to the speaker data
-        getFrame (bool, optional): if True, returns 
-            the information as a DataFrame. Otherwise, 
-            the information is returned as a dictionary.
-    
-    Returns:
-        a dictionary mapping each language to a list of its 
-        speakers' age and gender information, or a DataFrame
-        containing the same information
-    
-    Examples:
-        >>> speakerData = readSpeakerData('spkr-lsas.txt')
-        ...
-        >>> df_speaker = readSpeakerData('spkr-lsas.txt', getFrame=True)
-    '''
-    if getFrame:
-        data = pd.read_table(filename, header=None)     
-        # add the column names
-        columns = ['Language', 'Speaker', 'Age', 'Gender']
-        data.columns = columns
-        return data
-    # otherwise, read in as a dictionary
-    lines = _read_lines(filename)
-    speakerData = {}
-    # loop through the lines and add them to the dictionary
-    for l in lines:
-        # get the information from the line
-        [lang, spkr, age, gender] = l.split('\t')
-        # add the language dict if it doesn't exist
-        if int(lang) not in speakerData.keys():
-            speakerData[int(lang)] = {}
-        # get the language demographic dictionary
-        langDict = speakerData[int(lang)]
-        # add the speaker's age and gender
-        langDict[int(spkr)] = (int(age), gender)
-        
-    return speakerData
-
-### Mode maps
-def makeModeMap(data, lang=None):
-    """
-    Finds the mode map for a language given its naming data.
-    
-    Args:
-        data (dict): a dictionary containing either the full naming dictionary 
-            or the naming dictionary of a single language
-        lang (str, optional): the name of the language. if lang is 
-            not provided then data should be the naming data of a single 
-            language
-            
-    Returns:
-        a dictionary indexed by chip number with the modal values for each 
-        color
-    
-    Examples:
-        >>> mm_lang1 = makeModeMap(namingData, lang=1)
-        ...
-        >>> lang1 = namingData[1]
-        >>> mm_lang1 = makeModeMap(lang1)
-    """
-    # get the language naming data
-    if lang != None:
-        langData = data[lang]
-    else:
-        langData = data
-    
-    # create an empty mode map
-    modeMap = {}
-
-    # create a dictionary with all of the terms
-    allTerms = {}
-    # get the speaker naming data
-    for spkrData in langData.values():
-        # get the chip and color term
-        for chip, term in spkrData.items():
-            # if the chip isn't in allTerms, add it
-            if not (chip in allTerms.keys()):
-                allTerms[chip] = []
-            # append color term to allTerms
-            allTerms[chip].append(term)
-            
-    def findMode(aList):
-        freq = {}
-        for i in aList: freq[i] = freq.get(i, 0) + 1
-        freqlist = sorted(freq, key=freq.get, reverse=True)
-        mode = freqlist[0]
-        return mode
-
-    for chip, terms in allTerms.items():
-        mode = findMode(terms)
-        modeMap[chip] = mode
-
-    return modeMap
-
-### Grid colors
-def naming2grid(data, chip_to_rgb):
-    '''
-    Converts naming data to a grid of mean RGB values.
-    
-    Args:
-        data (dict): a dictionary mapping each chip number 
-            to a color term
-        chip_to_rgb (dict): a dictionary mapping each chip
-            number to its RGB values
-    
-    Returns:
-        a NumPy array containing the RGB values for each 
-        chip number, with values equal to the mean RGB 
-        values across all chips named by each color term
-        
-    Examples:
-        >>> grid_lang1_spkr1 = naming2grid(namingdata[1][1], chip_to_rgb)
-        ...
-        >>> mm_lang1 = makeModeMap(namingData, lang=1)
-        >>> grid_mode_lang1 = naming2grid(mm_lang1)
-    '''
-    term_colors = {}
-
-    for term in set(data.values()):
-        term_idx = np.where(np.array(list(data.values()))==term)[0]
-        rgbs = []
-        for chipnum in term_idx:
-            rgbs.append(chip_to_rgb[chipnum+1])
-
-        color_j_display_rbg = np.mean(np.array(rgbs),axis=0)/255.
-        term_colors[term] = [color_j_display_rbg[0],color_j_display_rbg[1],color_j_display_rbg[2]]
-
-    grid_colors = np.zeros((330,3))
-    for i in range(1, len(chip_to_rgb) + 1):
-        grid_colors[i-1] = term_colors[data[i]]
-
-    return grid_colors
-
-### Plotting
-    
-def _chip2ind(chipNum, chip_to_munsell):
-    '''
-    Returns the row and column index given 
-    a chip number and a dictionary mapping the 
-    chip number to its Munsell coordinates.
-    '''
-    ROWS = ['A','B','C','D','E','F','G','H','I','J']
-
-    row = ROWS.index(chip_to_munsell[chipNum][0])
-    col = int(chip_to_munsell[chipNum][1])
-
-    return row, col 
-
-def _grid2img(grid, chip_to_munsell):
-    '''
-    Turns a color grid into a plottable image, 
-    given a dictionary mapping each chip 
-    number to its Munsell coordinates.
-    '''
-    N_COLS = 41
-    N_ROWS = 10
-
-    img = np.ones((N_ROWS, N_COLS + 1, 3))
-    for chipNum in range(1, len(grid) + 1):
-        i , j = _chip2ind(chipNum, chip_to_munsell)
-        j = j + 1 if j>0 else j
-        img[i, j, :] = grid[chipNum - 1, :]
-        if img[i, j, 0] == 50:
-            img[i, j, :] = img[i, j, :]
-    return img
-
-def plotColorGrid(grid, chip_to_munsell, figsize=(20, 4)):
-    '''
-    Plots a color grid given a dictionary mapping 
-    each chip number to its Munsell coordinates.
-    
-    Args:
-        grid (dict): a NumPy array containing the 
-            RGB values for each chip number
-        chip_to_munsell (dict): a dictionary mapping
-            each chip number to its Munsell coordinates
-        figsize (tuple, optional): the figure size which
-            is fed into `plt.figure`
-    
-    Returns:
-        the figure and axes of the produced plot
-    
-    Examples:
-        >>> grid = naming2grid(namingdata[1][1], chip_to_rgb)
-        >>> plotColorGrid(grid, chip_to_munsell)
-        ...
-    '''
-    rowNames = ['A','B','C','D','E','F','G','H','I','J']
-    numCols = 41
-    numRows = 10
-            
-    fig = plt.figure(figsize=figsize)
-    axes = plt.axes()
-    # get the image
-    img = _grid2img(grid, chip_to_munsell)
-    plt.imshow(img)
-    for i in range(numRows):
-        plt.text(0.7, i, rowNames[i],
-                 fontsize=10,
-                 style='italic',
-                 horizontalalignment='left',
-                 verticalalignment='center')
-    for i in range(1, numCols):
-        plt.text(i+.75, 0, str(i),
-                 fontsize=10,
-                 style='italic',
-                 horizontalalignment='left',
-                 verticalalignment='center')
-    # ax.set_aspect('equal','datalim')
-    plt.axis('off')
-    return fig, axes
-    
-
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Mar 12 21:35:41 2018
+
+Adapted by Dmetri Hayes for the Spring 2018 version of CogSci 88
+
+@author: dmetri
+"""
+
+from collections import Counter, defaultdict, namedtuple
+from functools import lru_cache
+
+import pandas as pd
+import matplotlib.pyplot as plt
+import numpy as np
+
+__all__ = ['readChipData', 'readChipDataArrays', 'ChipArrays',
+           'get_chip_to_rgb', 'get_chip_to_munsell',
+           'readNamingData', 'readFociData', 'readSpeakerData', 'makeModeMap',
+           'makeAllModeMaps', 'naming2grid', 'plotColorGrid']
+
+# the WCS grid row letters, in row order, and the reverse lookup
+_ROWS = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J']
+_ROW_IDX = {c: i for i, c in enumerate(_ROWS)}
+
+### Color chip information
+@lru_cache(maxsize=8)
+def _read_chip_table(filename):
+    '''
+    Reads the raw chip information into a Pandas DataFrame,
+    parsing and converting every column in a single C-level pass.
+    The chip file is small and static, so repeat calls with the
+    same filename are served from the cache.
+    '''
+    data = pd.read_csv(filename, sep='\t', header=None, engine='c',
+                       dtype={0: np.int32, 1: np.int32, 2: np.int32,
+                              3: np.int32, 4: np.float64, 5: np.float64,
+                              6: np.float64, 7: str, 8: np.int32})
+    return data
+
+@lru_cache(maxsize=4)
+def readChipData(filename='chipnum-info.txt', getFrame=False):
+    '''
+    Reads the color information for each of the color 
+    chips as either a series of dictionaries or as a 
+    Pandas DataFrame.
+    
+    Args:
+        filename (str, optional): the path to the chip data
+        getFrame (bool, optional): if True, returns 
+            the information as a DataFrame. Otherwise, 
+            the information is returned as a series of
+            dictionaries.
+    
+    Returns:
+        four dictionaries, mapping:
+            -each chip number to its Munsell coordinates
+            -Munsell coordinates to the chip number
+            -each chip number to its CIELAB values
+            -each chip number to its RGB values
+        
+        or a DataFrame containing the chip number, 
+        lightness, hue, R, G, B, l a*, and b* values for
+        each of the color chips
+    
+    Examples:
+        >>> data = readChipData('chipnum-info.txt')
+        >>> munsell_to_chip, chip_to_munsell, chip_to_clab, chip_to_rgb = data
+        ...
+        >>> df_chip = readChipData('chipnum-info.txt', getFrame=True)
+    '''
+    data = _read_chip_table(filename)
+    if getFrame:
+        # rename a copy so the cached raw table keeps its numeric columns
+        data = data.copy()
+        columns = ['ChipNum', 'R', 'G', 'B', 'l', 'a', 'b', 'Lightness', 'Hue']
+        data.columns = columns
+        return data
+    # otherwise, build the dictionaries from the columnar arrays
+    chips = data[0].to_numpy().tolist()
+    rgb = data[[1, 2, 3]].to_numpy().tolist()
+    clab = data[[4, 5, 6]].to_numpy().tolist()
+    lightness = data[7].tolist()
+    hue = data[8].to_numpy().tolist()
+
+    # link each Munsell coordinates to the corresponding chip number
+    munsell_to_chip = dict(zip((L + str(H) for L, H in zip(lightness, hue)),
+                               chips))
+    # link each chip number to its Munsell coordinate tuple
+    chip_to_munsell = dict(zip(chips, zip(lightness, hue)))
+    # link each chip number to its CIELAB coordinates
+    chip_to_clab = dict(zip(chips, map(tuple, clab)))
+    # link each chip number to its RGB values tuple
+    chip_to_rgb = dict(zip(chips, map(tuple, rgb)))
+
+    return munsell_to_chip, chip_to_munsell, chip_to_clab, chip_to_rgb
+
+# columnar (structure-of-arrays) chip data: row i holds chip number i + 1
+ChipArrays = namedtuple('ChipArrays',
+                        ['rgb', 'clab', 'munsell_rows', 'munsell_cols'])
+
+@lru_cache(maxsize=4)
+def readChipDataArrays(filename='chipnum-info.txt'):
+    '''
+    Reads the color information for each of the color
+    chips into dense columnar NumPy arrays, ordered by
+    chip number. This layout avoids the per-chip tuple
+    allocations of the dictionary API and lets callers
+    run vectorized operations over all chips at once.
+
+    Args:
+        filename (str, optional): the path to the chip data
+
+    Returns:
+        a `ChipArrays` namedtuple with the fields:
+            -rgb: a (nChips, 3) uint8 array of RGB values
+            -clab: a (nChips, 3) float32 array of CIELAB values
+            -munsell_rows: a (nChips,) uint8 array of grid row indices
+            -munsell_cols: a (nChips,) uint8 array of grid column numbers
+
+    Examples:
+        >>> chipArrays = readChipDataArrays('chipnum-info.txt')
+        >>> grid = naming2grid(namingData[1][1], chipArrays)
+    '''
+    data = _read_chip_table(filename)
+    rgb = data[[1, 2, 3]].to_numpy(dtype=np.uint8)
+    clab = data[[4, 5, 6]].to_numpy(dtype=np.float32)
+    # turn the row letters into row indices
+    munsell_rows = np.array([_ROW_IDX[L] for L in data[7].tolist()],
+                            dtype=np.uint8)
+    munsell_cols = data[8].to_numpy(dtype=np.uint8)
+    return ChipArrays(rgb, clab, munsell_rows, munsell_cols)
+
+def get_chip_to_rgb(filename_or_dataframe):
+    '''
+    Gets the chip number to RGB values dictionary, either
+    by loading it from a file or extracting it from a 
+    Pandas DataFrame.
+    
+    Args:
+        filename_or_dataframe (str or `DataFrame`): the
+            path to the chip data or a DataFrame containing 
+            the chip numbers and RGB values
+    
+    Returns:
+        a dictionary mapping each chip number to its RGB values
+    
+    Examples:
+        >>> chip_to_rgb = get_chip_to_rgb('chipnum-info.txt')
+        ...
+        >>> chip_to_rgb = get_chip_to_rgb(df_chip)
+    '''
+    if isinstance(filename_or_dataframe, str):
+        # readChipData builds all four dictionaries in one cached pass
+        chip_to_rgb = readChipData(filename_or_dataframe)[3]
+    elif isinstance(filename_or_dataframe, pd.DataFrame):
+        df_chip = filename_or_dataframe
+        # get the chip numbers and the RGB values
+        chips = df_chip['ChipNum'].tolist()
+        rgb_vals = df_chip[['R', 'G', 'B']].to_numpy().tolist()
+        # create the dictionary
+        chip_to_rgb = dict(zip(chips, map(tuple, rgb_vals)))
+    else:
+        print('Warning: No data provided.')
+        chip_to_rgb = {}
+        
+    return chip_to_rgb
+    
+def get_chip_to_munsell(filename_or_dataframe):
+    '''
+    Gets the chip number to Munsell coordinates dictionary, 
+    either by loading it from a file or extracting it from 
+    a Pandas DataFrame.
+    
+    Args:
+        filename_or_dataframe (str or `DataFrame`): the
+            path to the chip data or a DataFrame containing 
+            the chip numbers and Munsell coordinates
+    
+    Returns:
+        a chip number mapping each chip number to its 
+        Munsell coordinates
+    
+    Examples:
+        >>> chip_to_munsell = get_chip_to_munsell('chipnum-info.txt')
+        ...
+        >>> chip_to_munsell = get_chip_to_munsell(df_chip)
+    '''
+    if isinstance(filename_or_dataframe, str):
+        # readChipData builds all four dictionaries in one cached pass
+        chip_to_munsell = readChipData(filename_or_dataframe)[1]
+    elif isinstance(filename_or_dataframe, pd.DataFrame):
+        df_chip = filename_or_dataframe
+        # get the chip numbers and the Munsell coordinates
+        chips = df_chip['ChipNum'].tolist()
+        lightness = df_chip['Lightness'].tolist()
+        hue = df_chip['Hue'].tolist()
+        # create the dictionary
+        chip_to_munsell = dict(zip(chips, zip(lightness, hue)))
+    else:
+        print('Warning: No data provided.')
+        chip_to_munsell = {}
+        
+    return chip_to_munsell
+
+### Naming data
+def readNamingData(filename='term.txt', getFrame=False):
+    '''
+    Loads the naming data into a hierarchical dictionary 
+    or as a Pandas DataFrame.
+    
+    Args:
+        filename (str, optional): the path to the naming data
+        getFrame (bool, optional): if True, returns 
+            the information as a DataFrame. Otherwise, 
+            the information is returned as a hierarchical
+            dictionaries.
+            
+    Returns:
+        a hierarchical dictionary mapping each language 
+        to each speaker's naming data, which maps each 
+        color index to their given color term, or a 
+        DataFrame with this same information
+    
+    Examples:
+        >>> namingData = readNamingData('term.txt')
+        ...
+        >>> df_naming = readNamingData('term.txt', getFrame=True)
+    '''
+    data = pd.read_csv(filename, sep='\t', header=None, engine='c',
+                       dtype={0: np.int32, 1: np.int32, 2: np.int32, 3: str},
+                       na_filter=False, memory_map=True)
+    # add the column names
+    columns = ['Language', 'Speaker', 'ChipNum', 'Term']
+    data.columns = columns
+    # the few distinct terms compress well as a categorical
+    data['Term'] = data['Term'].astype('category')
+    if getFrame:
+        return data
+    # otherwise, build the hierarchical dictionary with nested groupbys
+    namingData = {}
+    for lang, langFrame in data.groupby('Language', sort=False):
+        langDict = {}
+        for spkr, spkrFrame in langFrame.groupby('Speaker', sort=False):
+            # map each chip number to the speaker's term for it
+            langDict[int(spkr)] = dict(zip(spkrFrame['ChipNum'].tolist(),
+                                           spkrFrame['Term'].tolist()))
+        namingData[int(lang)] = langDict
+
+    return namingData
+
+### Foci data
+def readFociData(filename='foci-exp.txt', getFrame=False):
+    '''
+    Loads the foci data into a hierarchical dictionary 
+    or as a Pandas DataFrame.
+    
+    Args:
+        filename (str, optional): the path to the foci data
+        getFrame (bool, optional): if True, returns 
+            the information as a DataFrame. Otherwise, 
+            the information is returned as a hierarchical
+            dictionaries.
+            
+    Returns:
+        a hierarchical dictionary mapping each language 
+        to each speaker's naming data, which maps each 
+        color term to its foci Munsell coordinates, or a 
+        DataFrame with this same information
+    
+    Examples:
+        >>> fociData = readNamingData('foci-exp.txt')
+        ...
+        >>> df_foci = readFociData('foci-exp.txt', getFrame=True)
+    '''
+    data = pd.read_csv(filename, sep='\t', header=None, engine='c',
+                       dtype={0: np.int32, 1: np.int32, 2: np.int32,
+                              3: str, 4: str}, na_filter=False, memory_map=True)
+    # add the column names
+    columns = ['Language', 'Speaker', 'TermNum', 'Term', 'Foci']
+    data.columns = columns
+    # the few distinct terms compress well as a categorical
+    data['Term'] = data['Term'].astype('category')
+    # fix bad WCS entries: collapse A1-40 to A0 and J1-40 to J0,
+    # and separate lightness and hue values with a colon, all vectorized
+    first = data['Foci'].str[0]
+    rest = data['Foci'].str[1:].mask(first.isin(['A', 'J']), '0')
+    data['Foci'] = first.str.cat(rest, sep=':')
+    if getFrame:
+        return data
+    # otherwise, build the hierarchical dictionary with nested groupbys
+    fociData = {}
+    for lang, langFrame in data.groupby('Language', sort=False):
+        langDict = {}
+        for spkr, spkrFrame in langFrame.groupby('Speaker', sort=False):
+            spkrDict = {}
+            # map each term to the speaker's list of foci for it
+            for term, termFrame in spkrFrame.groupby('Term', sort=False):
+                spkrDict[term] = termFrame['Foci'].tolist()
+            langDict[int(spkr)] = spkrDict
+        fociData[int(lang)] = langDict
+
+    return fociData
+
+### Speaker data
+def readSpeakerData(filename='spkr-lsas.txt', getFrame=False):
+    '''
+    Loads the speaker's age and gender information into a 
+    dictionary or a Pandas DataFrame.
+    
+    Args:
+        filename (str, optional): the path to the speaker data
+        getFrame (bool, optional): if True, returns 
+            the information as a DataFrame. Otherwise, 
+            the information is returned as a dictionary.
+    
+    Returns:
+        a dictionary mapping each language to a list of its 
+        speakers' age and gender information, or a DataFrame
+        containing the same information
+    
+    Examples:
+        >>> speakerData = readSpeakerData('spkr-lsas.txt')
+        ...
+        >>> df_speaker = readSpeakerData('spkr-lsas.txt', getFrame=True)
+    '''
+    data = pd.read_csv(filename, sep='\t', header=None, engine='c',
+                       dtype={0: np.int32, 1: np.int32, 2: np.int32, 3: str},
+                       na_filter=False, memory_map=True)
+    # add the column names
+    columns = ['Language', 'Speaker', 'Age', 'Gender']
+    data.columns = columns
+    # the two gender codes compress well as a categorical
+    data['Gender'] = data['Gender'].astype('category')
+    if getFrame:
+        return data
+    # otherwise, build the dictionary with a groupby over languages
+    speakerData = {}
+    for lang, langFrame in data.groupby('Language', sort=False):
+        # map each speaker to their (age, gender) tuple
+        speakerData[int(lang)] = dict(zip(langFrame['Speaker'].tolist(),
+                                          zip(langFrame['Age'].tolist(),
+                                              langFrame['Gender'].tolist())))
+    return speakerData
+
+### Mode maps
+def makeAllModeMaps(data):
+    """
+    Finds the mode maps for every language in one
+    vectorized pass over the naming DataFrame.
+
+    Args:
+        data (`DataFrame`): the naming data as returned by
+            readNamingData with getFrame=True
+
+    Returns:
+        a hierarchical dictionary mapping each language to a
+        dictionary indexed by chip number with the modal term
+        for each color
+
+    Examples:
+        >>> df_naming = readNamingData('term.txt', getFrame=True)
+        >>> allModeMaps = makeAllModeMaps(df_naming)
+        >>> mm_lang1 = allModeMaps[1]
+    """
+    # count each (language, chip, term) combination; sort=False keeps
+    # first-occurrence order so ties break the same way as makeModeMap
+    counts = data.groupby(['Language', 'ChipNum', 'Term'],
+                          sort=False, observed=True).size()
+    # take the label of the largest count within each (language, chip)
+    modes = counts.groupby(level=['Language', 'ChipNum'], sort=False).idxmax()
+
+    # unpack the (language, chip, term) labels into the nested dict
+    allModeMaps = {}
+    for lang, chip, term in modes.tolist():
+        allModeMaps.setdefault(int(lang), {})[int(chip)] = term
+
+    return allModeMaps
+
+def makeModeMap(data, lang=None):
+    """
+    Finds the mode map for a language given its naming data.
+    
+    Args:
+        data (dict or `DataFrame`): a dictionary containing either the full
+            naming dictionary or the naming dictionary of a single language,
+            or the full naming DataFrame
+        lang (str, optional): the name of the language. if lang is
+            not provided then data should be the naming data of a single
+            language (or, for a DataFrame, the mode maps of every
+            language are returned)
+            
+    Returns:
+        a dictionary indexed by chip number with the modal values for each 
+        color
+    
+    Examples:
+        >>> mm_lang1 = makeModeMap(namingData, lang=1)
+        ...
+        >>> lang1 = namingData[1]
+        >>> mm_lang1 = makeModeMap(lang1)
+    """
+    # a naming DataFrame routes through the vectorized pass
+    if isinstance(data, pd.DataFrame):
+        allModeMaps = makeAllModeMaps(data)
+        if lang is not None:
+            return allModeMaps[lang]
+        return allModeMaps
+    # get the language naming data
+    if lang != None:
+        langData = data[lang]
+    else:
+        langData = data
+    
+    # count each chip's terms directly, with no per-chip term lists
+    counters = defaultdict(Counter)
+    # get the speaker naming data
+    for spkrData in langData.values():
+        # tally each color term for its chip
+        for chip, term in spkrData.items():
+            counters[chip][term] += 1
+
+    # take the most common term for each chip
+    modeMap = {chip: counts.most_common(1)[0][0]
+               for chip, counts in counters.items()}
+
+    return modeMap
+
+### Grid colors
+def naming2grid(data, chip_to_rgb):
+    '''
+    Converts naming data to a grid of mean RGB values.
+    
+    Args:
+        data (dict): a dictionary mapping each chip number
+            to a color term
+        chip_to_rgb (dict or `ChipArrays`): a dictionary mapping
+            each chip number to its RGB values, or the columnar
+            chip data from `readChipDataArrays`
+
+    Returns:
+        a NumPy array containing the RGB values for each 
+        chip number, with values equal to the mean RGB 
+        values across all chips named by each color term
+        
+    Examples:
+        >>> grid_lang1_spkr1 = naming2grid(namingdata[1][1], chip_to_rgb)
+        ...
+        >>> mm_lang1 = makeModeMap(namingData, lang=1)
+        >>> grid_mode_lang1 = naming2grid(mm_lang1)
+    '''
+    # the RGB table in chip number order, scaled to [0, 1]
+    if isinstance(chip_to_rgb, ChipArrays):
+        rgb_tbl = chip_to_rgb.rgb.astype(np.float64) / 255.
+    else:
+        rgb_tbl = np.array([chip_to_rgb[c]
+                            for c in range(1, len(chip_to_rgb) + 1)],
+                           dtype=np.float64) / 255.
+    nChips = len(rgb_tbl)
+    # the term given to each chip, in chip number order
+    terms = np.array([data[i] for i in range(1, nChips + 1)])
+    # compute the mean RGB values per term in a single grouped pass
+    df = pd.DataFrame({'term': terms, 'R': rgb_tbl[:, 0],
+                       'G': rgb_tbl[:, 1], 'B': rgb_tbl[:, 2]})
+    means = df.groupby('term')[['R', 'G', 'B']].mean()
+    # broadcast each term's mean color back onto its chips
+    grid_colors = means.loc[terms].to_numpy()
+
+    return grid_colors
+
+### Plotting
+    
+def _chip2ind(chipNum, chip_to_munsell):
+    '''
+    Returns the row and column index given 
+    a chip number and a dictionary mapping the 
+    chip number to its Munsell coordinates.
+    '''
+    row = _ROW_IDX[chip_to_munsell[chipNum][0]]
+    col = int(chip_to_munsell[chipNum][1])
+
+    return row, col
+
+# cache of the (rows, cols) index arrays, keyed per Munsell dictionary
+_chipIndCache = {}
+
+def _chip_inds(chip_to_munsell):
+    '''
+    Returns the row and column index arrays for every
+    chip number, with the grid column already shifted
+    past the achromatic column. Cached per dictionary
+    so the Python-level lookups run only once.
+    '''
+    cached = _chipIndCache.get(id(chip_to_munsell))
+    if cached is not None:
+        return cached
+    if isinstance(chip_to_munsell, ChipArrays):
+        rows = chip_to_munsell.munsell_rows.astype(np.intp)
+        cols = chip_to_munsell.munsell_cols.astype(np.intp)
+    else:
+        inds = [_chip2ind(c, chip_to_munsell)
+                for c in range(1, len(chip_to_munsell) + 1)]
+        rows = np.array([i for i, j in inds], dtype=np.intp)
+        cols = np.array([j for i, j in inds], dtype=np.intp)
+    # shift the chromatic columns right of the achromatic column
+    cols = np.where(cols > 0, cols + 1, cols)
+    _chipIndCache[id(chip_to_munsell)] = (rows, cols)
+    return rows, cols
+
+def _grid2img(grid, chip_to_munsell):
+    '''
+    Turns a color grid into a plottable image,
+    given a dictionary mapping each chip
+    number to its Munsell coordinates.
+    '''
+    N_COLS = 41
+    N_ROWS = 10
+
+    rows, cols = _chip_inds(chip_to_munsell)
+    img = np.ones((N_ROWS, N_COLS + 1, 3))
+    # place every chip's color with one fancy-indexed assignment
+    img[rows[:len(grid)], cols[:len(grid)], :] = grid
+    return img
+
+def plotColorGrid(grid, chip_to_munsell, figsize=(20, 4)):
+    '''
+    Plots a color grid given a dictionary mapping 
+    each chip number to its Munsell coordinates.
+    
+    Args:
+        grid (dict): a NumPy array containing the 
+            RGB values for each chip number
+        chip_to_munsell (dict or `ChipArrays`): a dictionary
+            mapping each chip number to its Munsell coordinates,
+            or the columnar chip data from `readChipDataArrays`
+        figsize (tuple, optional): the figure size which
+            is fed into `plt.figure`
+    
+    Returns:
+        the figure and axes of the produced plot
+    
+    Examples:
+        >>> grid = naming2grid(namingdata[1][1], chip_to_rgb)
+        >>> plotColorGrid(grid, chip_to_munsell)
+        ...
+    '''
+    numCols = 41
+    numRows = 10
+
+    fig = plt.figure(figsize=figsize)
+    axes = plt.axes()
+    # get the image
+    img = _grid2img(grid, chip_to_munsell)
+    axes.imshow(img, interpolation='nearest')
+    # label the rows and columns in one tick pass instead of 50 Text artists
+    axes.set_yticks(range(numRows))
+    axes.set_yticklabels(_ROWS, fontsize=10, style='italic')
+    # WCS column i sits one past the achromatic column in the image
+    axes.set_xticks(range(2, numCols + 1))
+    axes.set_xticklabels(range(1, numCols), fontsize=10, style='italic')
+    # hide the frame and tick marks but keep the labels
+    axes.tick_params(length=0)
+    for spine in axes.spines.values():
+        spine.set_visible(False)
+    return fig, axes
+    
+
 ### 3D colorspace with plotly(?)
\ No newline at end of file
@@ -51,12 +51,10 @@ def readNamingData(namingDataFilePath):
         chipNumber = int(lineElements[2])     		# 3rd is chip number, make int
         languageTerm = lineElements[3]           	# 4th is languageTermegory assignment (term), keep string
         
-        if not (languageNumber in namingData.keys()):    						# if this language isn't a key in the namingData dict
-            namingData[languageNumber] = {}              							# then make it one, with its value an empty list
-        if not (speakerNumber in namingData[languageNumber].keys()):   			# if this speaker isn't a key in the languageNumber dict
-            namingData[languageNumber][speakerNumber] = {}             				# then make it one, with its value an empty list
-        
-        namingData[languageNumber][speakerNumber][chipNumber] = languageTerm  	# fill in these empty lists to make a GIANT namingData dictionary
+        languageDict = namingData.setdefault(languageNumber, {})	# get this language's dict, adding it if it isn't there yet
+        speakerDict = languageDict.setdefault(speakerNumber, {})	# same for this speaker's dict, one hash lookup each
+
+        speakerDict[chipNumber] = languageTerm  	# fill in these empty lists to make a GIANT namingData dictionary
                                             									# where each entry looks like this: {1: {1: {1: 'LB'}}
                                             									# and thus namingData[1][1][1] returns string 'LB'
     
@@ -102,26 +100,20 @@ def readFociData(fociDataFilePath):
         gridcoord = lineElements[4]				# 5th is chip grid coord
         
         # fix WCS bad entries - collapse A1-40 to A0 and J1-40 to J0
-        if (gridcoord[0] == 'A'):
-            if (int(gridcoord[1:]) > 0):
-                gridcoord = "A0"
-        
-        if (gridcoord[0] == 'J'):
-            if (int(gridcoord[1:]) > 0):
-                gridcoord = "J0"
+        # (single first-character test instead of two independent branches)
+        firstChar = gridcoord[0]
+        if (firstChar == 'A' or firstChar == 'J') and int(gridcoord[1:]) > 0:
+            gridcoord = firstChar + "0"
 
-        modGridCoord = gridcoord[0] + ":" + gridcoord[1:]	# make it nicer for parsing purposes later
+        modGridCoord = f"{gridcoord[0]}:{gridcoord[1:]}"	# make it nicer for parsing purposes later
         
 
-        if not (languageNumber in fociData.keys()):	# if this language isn't a key in the fociData dict
-            fociData[languageNumber] = {}			# then make it one, with its value an empty list
-        if not (speakerNumber in fociData[languageNumber].keys()):	# if this speaker isn't a key in the languageNumber dict
-            fociData[languageNumber][speakerNumber] = {}			# then make it one, with its value an empty list
-        if not (languageTerm in fociData[languageNumber][speakerNumber].keys()):	# if this term isn't a key in the speakerNumber dict
-            fociData[languageNumber][speakerNumber][languageTerm] = []			# then make it one, with its value an empty list
-            
-        if not(modGridCoord in fociData[languageNumber][speakerNumber][languageTerm]): # if they provided multiple A0 or J0 hits, only record 1
-            fociData[languageNumber][speakerNumber][languageTerm].append(modGridCoord)
+        languageDict = fociData.setdefault(languageNumber, {})	# get this language's dict, adding it if it isn't there yet
+        speakerDict = languageDict.setdefault(speakerNumber, {})	# same for this speaker's dict
+        fociList = speakerDict.setdefault(languageTerm, [])		# and for this term's foci list, one hash lookup each
+
+        if not(modGridCoord in fociList): # if they provided multiple A0 or J0 hits, only record 1
+            fociList.append(modGridCoord)
         
     fileHandler.close()
     return fociData 
@@ -203,12 +195,10 @@ def readSpeakerData(speakerFilePath):
         speaker_ID = int(content[1])
         speaker_age = content[2]      #Age is the third element of row
         speaker_gender = content[3]   #Gender is the fourth element of row
-        if not (language_ID in speakers.keys()):	
-            speakers[language_ID] = {}			
-        if not (speaker_ID in speakers[language_ID].keys()):
-            speakers[language_ID][speaker_ID] = []
-        if not((speaker_age, speaker_gender) in speakers[language_ID][speaker_ID]):
-            speakers[language_ID][speaker_ID].append((speaker_age, speaker_gender))
+        languageDict = speakers.setdefault(language_ID, {})     #get this language's dict, adding it if it isn't there yet
+        speakerList = languageDict.setdefault(speaker_ID, [])   #same for this speaker's list, one hash lookup each
+        if not((speaker_age, speaker_gender) in speakerList):
+            speakerList.append((speaker_age, speaker_gender))
     return speakers
 
 def readClabData(clabFilePath):
@@ -5,6 +5,8 @@ Created on Fri Mar  2 16:06:23 2018
 @author: dmetri
 """
 
+import numpy as np
+import pandas as pd
 from datascience import Table
 from wcs_helper_functions import readChipData
 from wcs_helper_functions import readClabData
@@ -57,8 +59,10 @@ def loadChipTables(*chipData):
     # sort the keys and get the sorted values
     sorted_keys, sorted_values = _get_sorted_keys_and_values(coord_to_index)
 
-    coordToIndexTable = Table().with_columns('Coordinate', sorted_keys, 
-                             'Index', sorted_values)
+    # hand with_columns typed arrays so it skips its own inference pass
+    coordToIndexTable = Table().with_columns('Coordinate', np.array(sorted_keys),
+                             'Index', np.fromiter(sorted_values, dtype=np.int32,
+                                                  count=len(sorted_values)))
 
     # index to lightness, hue coordinate
     # get the dictionaries
@@ -66,12 +70,13 @@ def loadChipTables(*chipData):
     # sort the keys and get the sorted values
     sorted_keys, sorted_values = _get_sorted_keys_and_values(index_to_coord)
     # unzip the lightness and hue values
-    unzipped_values = [v for v in zip(*sorted_values)]
-    # get the lightness and hue values
-    lightness, hue = unzipped_values
-    
-    indexToCoordTable = Table().with_columns('Coordinate', sorted_keys, 
-                             'Lightness', lightness, 'Hue', hue)
+    lightness, hue = zip(*sorted_values)
+
+    indexToCoordTable = Table().with_columns('Coordinate',
+                             np.fromiter(sorted_keys, dtype=np.int32,
+                                         count=len(sorted_keys)),
+                             'Lightness', np.array(lightness),
+                             'Hue', np.array(hue))
 
     return coordToIndexTable, indexToCoordTable
     
@@ -90,13 +95,13 @@ def loadClabTable(index_to_clab):
     '''
     # sort the keys and get the sorted values
     sorted_keys, sorted_values = _get_sorted_keys_and_values(index_to_clab)
-    # get the l, a and b values
-    l = [v[0] for v in sorted_values]
-    a = [v[1] for v in sorted_values]
-    b = [v[2] for v in sorted_values]
-    
-    clabTable = Table().with_columns('Index', sorted_keys, 'l', l,
-                    'a', a, 'b', b)
+    # get the l, a and b values as arrays
+    l, a, b = (np.array(col) for col in zip(*sorted_values))
+
+    clabTable = Table().with_columns('Index',
+                    np.fromiter(sorted_keys, dtype=np.int32,
+                                count=len(sorted_keys)),
+                    'l', l, 'a', a, 'b', b)
     return clabTable
 
 
@@ -105,34 +110,38 @@ def loadNamingTable(namingData):
     Loads the naming data into a datascience Table.
     
     Args:
-        namingData (dict): a hierarchical dictionary mapping each language 
-            to each speaker's naming data, which maps each color index to 
-            their given color term
-            
+        namingData (dict or `DataFrame`): a hierarchical dictionary
+            mapping each language to each speaker's naming data, which
+            maps each color index to their given color term, or a
+            DataFrame with the same information
+
     Returns:
         the same information in a datascience Table
     '''
-    # create lists for the information
-    language = []
-    speaker = []
-    index = []
-    color_term = []
-    
-    # loop through the languages
-    for lang in namingData:
-        # loop through the speakers
-        for spkr in namingData[lang]:
-            # loop through the color index
-            for i in namingData[lang][spkr]:
-                # get the color term
-                term = namingData[lang][spkr][i]
-                
-                # add to the lists
-                language.append(lang)
-                speaker.append(spkr)
-                index.append(i)
-                color_term.append(term)
-                
+    # a DataFrame converts directly, no retabulation needed
+    if isinstance(namingData, pd.DataFrame):
+        return Table.from_df(namingData)
+    # count the rows so the arrays can be allocated once
+    nRows = sum(len(spkrData) for langData in namingData.values()
+                for spkrData in langData.values())
+    # preallocate the columns
+    language = np.empty(nRows, dtype=np.int32)
+    speaker = np.empty(nRows, dtype=np.int32)
+    index = np.empty(nRows, dtype=np.int32)
+    color_term = np.empty(nRows, dtype=object)
+
+    # fill the columns one speaker block at a time
+    pos = 0
+    for lang, langData in namingData.items():
+        for spkr, spkrData in langData.items():
+            n = len(spkrData)
+            language[pos:pos + n] = lang
+            speaker[pos:pos + n] = spkr
+            index[pos:pos + n] = np.fromiter(spkrData.keys(),
+                                             dtype=np.int32, count=n)
+            color_term[pos:pos + n] = list(spkrData.values())
+            pos += n
+
     # turn into a table
     namingTable = Table().with_columns('Language', language, 'Speaker', speaker,
                        'Index', index, 'Term', color_term)
@@ -143,33 +152,39 @@ def loadFociTable(fociData):
     Loads the foci data into a datascience Table.
     
     Args:
-        fociData (dict): a hierarchical dictionary mapping each language 
-            to each speaker's foci data, which maps each color term to 
-            that color's (perhaps multiple) foci coordinates
-            
+        fociData (dict or `DataFrame`): a hierarchical dictionary
+            mapping each language to each speaker's foci data, which
+            maps each color term to that color's (perhaps multiple)
+            foci coordinates, or a DataFrame with the same information
+
     Returns:
         the same information in a datascience Table
     '''
-    # create lists for the information
-    language = []
-    speaker = []
-    color_term = []
-    foci_coord = []
-    
-    # loop through the languages
-    for lang in fociData:
-        # loop through the speakers
-        for spkr in fociData[lang]:
-            # loop through the color terms
-            for term in fociData[lang][spkr]:
-                # loop through the foci coordinates
-                for coord in fociData[lang][spkr][term]:
-                    # add to the lists
-                    language.append(lang)
-                    speaker.append(spkr)
-                    color_term.append(term)
-                    foci_coord.append(coord)
-                
+    # a DataFrame converts directly, no retabulation needed
+    if isinstance(fociData, pd.DataFrame):
+        return Table.from_df(fociData)
+    # count the rows so the arrays can be allocated once
+    nRows = sum(len(coords) for langData in fociData.values()
+                for spkrData in langData.values()
+                for coords in spkrData.values())
+    # preallocate the columns
+    language = np.empty(nRows, dtype=np.int32)
+    speaker = np.empty(nRows, dtype=np.int32)
+    color_term = np.empty(nRows, dtype=object)
+    foci_coord = np.empty(nRows, dtype=object)
+
+    # fill the columns one term block at a time
+    pos = 0
+    for lang, langData in fociData.items():
+        for spkr, spkrData in langData.items():
+            for term, coords in spkrData.items():
+                n = len(coords)
+                language[pos:pos + n] = lang
+                speaker[pos:pos + n] = spkr
+                color_term[pos:pos + n] = term
+                foci_coord[pos:pos + n] = coords
+                pos += n
+
     # turn into a table
     fociTable = Table().with_columns('Language', language, 'Speaker', speaker,
                        'Term', color_term, 'Foci', foci_coord)
@@ -186,26 +201,29 @@ def loadSpeakerTable(speakerData):
     Returns:
         the same information in a datascience Table
     '''
-    # create lsits for the information
-    language = []
-    speaker = []
-    age = []
-    gender = []
-    
-    # loop through the languages
-    for lang in speakerData:
-        # loop through the speakers
-        for spkr in speakerData[lang]:
-            # add to the lists
-            language.append(lang)
-            speaker.append(spkr)
-            # get the age and gender
-            a, g = speakerData[lang][spkr][0]
-            age.append(a)
-            gender.append(g)
-    
+    # count the rows so the arrays can be allocated once
+    nRows = sum(len(langData) for langData in speakerData.values())
+    # preallocate the columns
+    language = np.empty(nRows, dtype=np.int32)
+    speaker = np.empty(nRows, dtype=np.int32)
+    age = np.empty(nRows, dtype=object)
+    gender = np.empty(nRows, dtype=object)
+
+    # fill the columns one language block at a time
+    pos = 0
+    for lang, langData in speakerData.items():
+        n = len(langData)
+        language[pos:pos + n] = lang
+        speaker[pos:pos + n] = np.fromiter(langData.keys(),
+                                           dtype=np.int32, count=n)
+        # get the age and gender
+        info = [spkrInfo[0] for spkrInfo in langData.values()]
+        age[pos:pos + n] = [a for a, g in info]
+        gender[pos:pos + n] = [g for a, g in info]
+        pos += n
+
     # turn into a table
-    speakerTable = Table().with_columns('Language', language, 'Speaker', 
+    speakerTable = Table().with_columns('Language', language, 'Speaker',
                         speaker, 'Age', age, 'Gender', gender)
     return speakerTable
 